@@ -1,3 +1,4 @@
+import io
 import pandas as pd
 import numpy as np
 from datetime import datetime
@@ -5,8 +6,12 @@ from collections import defaultdict
 
 
 def load_data(filepath):
-    """Load CSV file into pandas DataFrame."""
-    df = pd.read_csv(filepath)
+    """Load CSV file into pandas DataFrame.
+
+    Uses the multithreaded pyarrow parser and Arrow-backed columns, which
+    parse faster and hold strings far more compactly than object arrays.
+    """
+    df = pd.read_csv(filepath, engine='pyarrow', dtype_backend='pyarrow')
     # Strip whitespace from column names
     df.columns = df.columns.str.strip()
     return df
@@ -14,21 +19,20 @@ def load_data(filepath):
 
 def analyze_completeness(df):
     """Calculate completeness percentage for each column."""
-    completeness = {}
     total_rows = len(df)
-    
-    for col in df.columns:
-        non_null_count = df[col].notna().sum()
-        # Also check for empty strings
-        empty_strings = (df[col] == '').sum()
-        valid_count = non_null_count - empty_strings
-        percentage = (valid_count / total_rows) * 100
-        completeness[col] = {
-            'percentage': round(percentage, 1),
-            'missing': total_rows - valid_count
+
+    # One fused mask over the whole frame instead of two reductions per column
+    missing_mask = df.isna() | df.eq('')
+    missing_counts = missing_mask.sum(axis=0)
+    percentages = ((total_rows - missing_counts) / total_rows * 100).round(1)
+
+    return {
+        col: {
+            'percentage': float(percentages[col]),
+            'missing': int(missing_counts[col])
         }
-    
-    return completeness
+        for col in df.columns
+    }
 
 
 def analyze_data_types(df):
@@ -36,23 +40,25 @@ def analyze_data_types(df):
     dtypes = {}
     
     for col in df.columns:
-        detected_type = str(df[col].dtype)
-        
-        # Check if column should be numeric
+        dtype = df[col].dtype
+        detected_type = str(dtype)
+
+        # Check if column should be numeric; dtype predicates cover both
+        # numpy and Arrow-backed columns
         if col == 'customer_id':
             expected = 'INT'
-            is_valid = detected_type in ['int64', 'float64']
+            is_valid = pd.api.types.is_integer_dtype(dtype)
         elif col == 'income':
             expected = 'NUMERIC'
-            is_valid = detected_type in ['int64', 'float64'] or df[col].dtype == 'object'
+            is_valid = pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_string_dtype(dtype)
         elif col in ['date_of_birth', 'created_date']:
             expected = 'DATE'
-            is_valid = detected_type == 'datetime64[ns]'
-            if not is_valid:
-                is_valid = 'object'  # Will need conversion
+            # String dates are acceptable here; they get converted downstream
+            is_valid = (pd.api.types.is_datetime64_any_dtype(dtype)
+                        or pd.api.types.is_string_dtype(dtype))
         else:
             expected = 'STRING'
-            is_valid = detected_type == 'object'
+            is_valid = pd.api.types.is_string_dtype(dtype) or dtype == object
         
         dtypes[col] = {
             'detected': detected_type,
@@ -63,50 +69,71 @@ def analyze_data_types(df):
     return dtypes
 
 
-def analyze_format_issues(df):
-    """Analyze format inconsistencies in phone numbers and dates."""
+def analyze_format_issues(df, dob_str=None, created_str=None,
+                          dob_bad=None, created_bad=None):
+    """Analyze format inconsistencies in phone numbers and dates.
+
+    The stripped date Series and their invalid_date masks can be passed in
+    to avoid rescanning the columns when the caller already computed them.
+    """
     issues = defaultdict(list)
-    
-    # Phone format analysis
-    phone_patterns = df['phone'].astype(str).tolist()
-    formats_found = set()
-    for phone in phone_patterns:
-        if pd.notna(phone):
-            if '555-' in phone and phone.count('-') == 2:
-                formats_found.add('XXX-XXX-XXXX')
-            elif '(' in phone and ')' in phone:
-                formats_found.add('(XXX) XXX-XXXX')
-            elif '.' in phone:
-                formats_found.add('XXX.XXX.XXXX')
-            elif phone.isdigit() and len(phone) == 10:
-                formats_found.add('XXXXXXXXXX')
-            else:
-                formats_found.add('OTHER')
-    
-    issues['phone_formats'] = list(formats_found)
-    
+
+    if dob_str is None:
+        dob_str = df['date_of_birth'].astype('string').str.strip()
+    if created_str is None:
+        created_str = df['created_date'].astype('string').str.strip()
+    if dob_bad is None:
+        dob_bad = dob_str.eq('invalid_date').fillna(False)
+    if created_bad is None:
+        created_bad = created_str.eq('invalid_date').fillna(False)
+
+    # Phone format analysis: classify the whole column with boolean masks,
+    # mirroring the old per-row if/elif precedence
+    phone = df['phone'].astype(str)
+    m_dash = phone.str.contains('555-', regex=False) & (phone.str.count('-') == 2)
+    m_paren = (~m_dash & phone.str.contains('(', regex=False)
+               & phone.str.contains(')', regex=False))
+    m_dot = ~m_dash & ~m_paren & phone.str.contains('.', regex=False)
+    m_plain = ~m_dash & ~m_paren & ~m_dot & phone.str.fullmatch(r'\d{10}')
+    m_other = ~(m_dash | m_paren | m_dot | m_plain)
+
+    format_masks = [
+        ('XXX-XXX-XXXX', m_dash),
+        ('(XXX) XXX-XXXX', m_paren),
+        ('XXX.XXX.XXXX', m_dot),
+        ('XXXXXXXXXX', m_plain),
+        ('OTHER', m_other),
+    ]
+    issues['phone_formats'] = [label for label, mask in format_masks
+                               if bool(mask.any())]
+
     # Date format analysis
+    dob_slash = (dob_str.notna() & dob_str.ne('') & ~dob_bad
+                 & dob_str.str.contains('/', regex=False))
+
     dob_issues = []
-    for idx, date_val in enumerate(df['date_of_birth']):
-        if pd.notna(date_val) and date_val != '':
-            date_str = str(date_val).strip()
-            if date_str == 'invalid_date':
-                dob_issues.append(f'Row {idx+2}: invalid_date')
-            elif '/' in date_str:
-                dob_issues.append(f'Row {idx+2}: {date_str} (YYYY/MM/DD format)')
-    
+    dob_values = dob_str.to_numpy(dtype=object)
+    for idx in np.flatnonzero((dob_bad | dob_slash).to_numpy()):
+        if dob_bad.iloc[idx]:
+            dob_issues.append(f'Row {idx+2}: invalid_date')
+        else:
+            dob_issues.append(f'Row {idx+2}: {dob_values[idx]} (YYYY/MM/DD format)')
+
+    created_slash = (created_str.notna() & created_str.ne('') & ~created_bad
+                     & created_str.str.contains('/', regex=False)
+                     & created_str.str[0].str.isdigit().fillna(False))
+
     created_date_issues = []
-    for idx, date_val in enumerate(df['created_date']):
-        if pd.notna(date_val) and date_val != '':
-            date_str = str(date_val).strip()
-            if date_str == 'invalid_date':
-                created_date_issues.append(f'Row {idx+2}: invalid_date')
-            elif '/' in date_str and date_str[0].isdigit():
-                created_date_issues.append(f'Row {idx+2}: {date_str} (MM/DD/YYYY format)')
-    
+    created_values = created_str.to_numpy(dtype=object)
+    for idx in np.flatnonzero((created_bad | created_slash).to_numpy()):
+        if created_bad.iloc[idx]:
+            created_date_issues.append(f'Row {idx+2}: invalid_date')
+        else:
+            created_date_issues.append(f'Row {idx+2}: {created_values[idx]} (MM/DD/YYYY format)')
+
     issues['date_of_birth_issues'] = dob_issues
     issues['created_date_issues'] = created_date_issues
-    
+
     return issues
 
 
@@ -123,121 +150,137 @@ def analyze_uniqueness(df):
     }
 
 
-def analyze_invalid_values(df):
-    """Identify invalid values in the dataset."""
+def analyze_invalid_values(df, dob_str=None, dob_bad=None, created_bad=None):
+    """Identify invalid values in the dataset.
+
+    Accepts precomputed date Series/masks from the caller so the date
+    columns are only scanned once per run.
+    """
     invalid_issues = []
-    
+
+    if dob_str is None:
+        dob_str = df['date_of_birth'].astype('string').str.strip()
+    if dob_bad is None:
+        dob_bad = dob_str.eq('invalid_date').fillna(False)
+    if created_bad is None:
+        created_bad = df['created_date'].astype('string').str.strip().eq('invalid_date').fillna(False)
+
     # Check for invalid dates
-    for idx, date_val in enumerate(df['date_of_birth']):
-        if pd.notna(date_val) and str(date_val).strip() == 'invalid_date':
-            invalid_issues.append(f"Row {idx+2}: date_of_birth = 'invalid_date'")
-    
-    for idx, date_val in enumerate(df['created_date']):
-        if pd.notna(date_val) and str(date_val).strip() == 'invalid_date':
-            invalid_issues.append(f"Row {idx+2}: created_date = 'invalid_date'")
-    
+    for idx in np.flatnonzero(dob_bad.to_numpy()):
+        invalid_issues.append(f"Row {idx+2}: date_of_birth = 'invalid_date'")
+
+    for idx in np.flatnonzero(created_bad.to_numpy()):
+        invalid_issues.append(f"Row {idx+2}: created_date = 'invalid_date'")
+
     # Check for negative income
-    for idx, income in enumerate(df['income']):
-        if pd.notna(income):
-            try:
-                income_val = float(income)
-                if income_val < 0:
-                    invalid_issues.append(f"Row {idx+2}: income = {income_val} (negative)")
-            except:
-                pass
-    
-    # Check for unrealistic ages (if we can parse the date)
+    income = pd.to_numeric(df['income'], errors='coerce')
+    income_values = income.to_numpy()
+    for idx in np.flatnonzero((income < 0).fillna(False).to_numpy()):
+        invalid_issues.append(f"Row {idx+2}: income = {income_values[idx]} (negative)")
+
+    # Check for unrealistic ages (if we can parse the date). The leading
+    # segment may be fewer than 4 digits (e.g. '25-12-1990'); matching it
+    # anyway keeps parity with int(value.split('-')[0]) so malformed dates
+    # still surface through the age check
     current_year = datetime.now().year
-    for idx, date_val in enumerate(df['date_of_birth']):
-        if pd.notna(date_val) and str(date_val).strip() not in ['', 'invalid_date']:
-            try:
-                if '-' in str(date_val):
-                    year = int(str(date_val).split('-')[0])
-                    age = current_year - year
-                    if age > 150:
-                        invalid_issues.append(f"Row {idx+2}: age = {age} (unrealistic)")
-            except:
-                pass
-    
+    year = dob_str.str.extract(r'^(\d{1,4})-')[0].astype('Int64')
+    age = current_year - year
+    unrealistic = (age > 150).fillna(False)
+    for idx in np.flatnonzero(unrealistic.to_numpy()):
+        invalid_issues.append(f"Row {idx+2}: age = {age.iloc[idx]} (unrealistic)")
+
     return invalid_issues
 
 
-def analyze_categorical_validity(df):
-    """Check if account_status contains only valid values."""
+def analyze_categorical_validity(df, status_str=None):
+    """Check if account_status contains only valid values.
+
+    A pre-stripped account_status Series can be passed in so the column
+    is not re-stripped cell by cell.
+    """
     valid_statuses = {'active', 'inactive', 'suspended'}
     issues = []
-    
-    for idx, status in enumerate(df['account_status']):
-        if pd.notna(status) and str(status).strip() != '':
-            status_clean = str(status).strip()
-            if status_clean not in valid_statuses:
-                issues.append(f"Row {idx+2}: '{status}' (invalid value)")
-        elif pd.isna(status) or str(status).strip() == '':
+
+    if status_str is None:
+        status_str = df['account_status'].astype('string').str.strip()
+
+    raw_values = df['account_status'].to_numpy(dtype=object)
+    for idx, status in enumerate(status_str.to_numpy(dtype=object)):
+        if pd.notna(status) and status != '':
+            if status not in valid_statuses:
+                issues.append(f"Row {idx+2}: '{raw_values[idx]}' (invalid value)")
+        else:
             issues.append(f"Row {idx+2}: Empty (missing value)")
-    
+
     return issues
 
 
 def generate_report(df, completeness, dtypes, format_issues, uniqueness, invalid_values, categorical_issues):
     """Generate the data quality report."""
-    report = []
-    report.append("DATA QUALITY PROFILE REPORT")
-    report.append("=" * 50)
-    report.append("")
+    buf = io.StringIO()
+
+    def w(line=''):
+        if buf.tell():
+            buf.write('\n')
+        buf.write(line)
+
+    w("DATA QUALITY PROFILE REPORT")
+    w("=" * 50)
+    w("")
     
     # Completeness section
-    report.append("COMPLETENESS:")
+    w("COMPLETENESS:")
     for col, stats in completeness.items():
         missing_info = f" ({stats['missing']} missing)" if stats['missing'] > 0 else ""
-        report.append(f"- {col}: {stats['percentage']}%{missing_info}")
-    report.append("")
+        w(f"- {col}: {stats['percentage']}%{missing_info}")
+    w("")
     
     # Data types section
-    report.append("DATA TYPES:")
+    w("DATA TYPES:")
     for col, info in dtypes.items():
-        report.append(f"- {col}: {info['detected']} {info['valid']} (expected: {info['expected']})")
-    report.append("")
+        w(f"- {col}: {info['detected']} {info['valid']} (expected: {info['expected']})")
+    w("")
     
     # Quality issues section
-    report.append("QUALITY ISSUES:")
-    report.append("1. Format Inconsistencies:")
-    report.append(f"   - Phone formats found: {', '.join(format_issues['phone_formats'])}")
+    w("QUALITY ISSUES:")
+    w("1. Format Inconsistencies:")
+    w(f"   - Phone formats found: {', '.join(format_issues['phone_formats'])}")
     if format_issues['date_of_birth_issues']:
-        report.append("   - Date of birth issues:")
+        w("   - Date of birth issues:")
         for issue in format_issues['date_of_birth_issues']:
-            report.append(f"     * {issue}")
+            w(f"     * {issue}")
     if format_issues['created_date_issues']:
-        report.append("   - Created date issues:")
+        w("   - Created date issues:")
         for issue in format_issues['created_date_issues']:
-            report.append(f"     * {issue}")
+            w(f"     * {issue}")
     
-    report.append("")
-    report.append("2. Uniqueness Issues:")
-    report.append(f"   - customer_id: {uniqueness['unique']}/{uniqueness['total']} unique")
+    w("")
+    w("2. Uniqueness Issues:")
+    w(f"   - customer_id: {uniqueness['unique']}/{uniqueness['total']} unique")
     if uniqueness['duplicates'] > 0:
-        report.append(f"   - Duplicate IDs found: {uniqueness['duplicates']}")
+        w(f"   - Duplicate IDs found: {uniqueness['duplicates']}")
     else:
-        report.append("   - All IDs are unique ✓")
+        w("   - All IDs are unique ✓")
     
-    report.append("")
-    report.append("3. Invalid Values:")
+    w("")
+    w("3. Invalid Values:")
     if invalid_values:
         for issue in invalid_values:
-            report.append(f"   - {issue}")
+            w(f"   - {issue}")
     else:
-        report.append("   - None found ✓")
+        w("   - None found ✓")
     
-    report.append("")
-    report.append("4. Categorical Validity (account_status):")
+    w("")
+    w("4. Categorical Validity (account_status):")
     if categorical_issues:
         for issue in categorical_issues:
-            report.append(f"   - {issue}")
+            w(f"   - {issue}")
     else:
-        report.append("   - All values valid ✓")
+        w("   - All values valid ✓")
     
     # Severity assessment
-    report.append("")
-    report.append("SEVERITY:")
+    w("")
+    w("SEVERITY:")
     
     critical = 0
     high = 0
@@ -263,15 +306,15 @@ def generate_report(df, completeness, dtypes, format_issues, uniqueness, invalid
             else:
                 medium += stats['missing']
     
-    report.append(f"- Critical (blocks processing): {critical}")
-    report.append(f"- High (data incorrect): {high}")
-    report.append(f"- Medium (needs cleaning): {medium}")
-    report.append("")
+    w(f"- Critical (blocks processing): {critical}")
+    w(f"- High (data incorrect): {high}")
+    w(f"- Medium (needs cleaning): {medium}")
+    w("")
     
-    report.append("=" * 50)
-    report.append("Report generated: Part 1 Complete")
+    w("=" * 50)
+    w("Report generated: Part 1 Complete")
     
-    return "\n".join(report)
+    return buf.getvalue()
 
 
 def main():
@@ -279,13 +322,22 @@ def main():
     # Load data
     df = load_data('data/customer_raw.csv')
     
+    # Strip the date columns once and share the invalid_date masks between
+    # the format and invalid-value analyses
+    dob_str = df['date_of_birth'].astype('string').str.strip()
+    created_str = df['created_date'].astype('string').str.strip()
+    dob_bad = dob_str.eq('invalid_date').fillna(False)
+    created_bad = created_str.eq('invalid_date').fillna(False)
+    status_str = df['account_status'].astype('string').str.strip()
+
     # Run all analyses
     completeness = analyze_completeness(df)
     dtypes = analyze_data_types(df)
-    format_issues = analyze_format_issues(df)
+    format_issues = analyze_format_issues(df, dob_str, created_str,
+                                          dob_bad, created_bad)
     uniqueness = analyze_uniqueness(df)
-    invalid_values = analyze_invalid_values(df)
-    categorical_issues = analyze_categorical_validity(df)
+    invalid_values = analyze_invalid_values(df, dob_str, dob_bad, created_bad)
+    categorical_issues = analyze_categorical_validity(df, status_str)
     
     # Generate report
     report = generate_report(df, completeness, dtypes, format_issues, 
@@ -1,5 +1,13 @@
 import pandas as pd
 import re
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.cleaning import keep_digits
+
+# Compiled once at import; shared by the scalar and vectorized maskers
+_NON_DIGIT_RE = re.compile(r'\D')
 
 
 def mask_name(name):
@@ -41,7 +49,7 @@ def mask_phone(phone):
 
     phone_str = str(phone).strip()
 
-    digits = re.sub(r'\D', '', phone_str)
+    digits = keep_digits(phone_str)
 
     if len(digits) >= 4:
         last_four = digits[-4:]
@@ -72,26 +80,45 @@ def mask_address(address):
 
 
 def mask_dataframe(df):
-    """Apply masking to all PII columns in the DataFrame."""
-    df_masked = df.copy()
-
-    if 'first_name' in df_masked.columns:
-        df_masked['first_name'] = df_masked['first_name'].apply(mask_name)
+    """Apply masking to all PII columns using vectorized string operations."""
+    # Shallow copy: Copy-on-Write forks only the columns that get masked
+    df_masked = df.copy(deep=False)
 
-    if 'last_name' in df_masked.columns:
-        df_masked['last_name'] = df_masked['last_name'].apply(mask_name)
+    for col in ('first_name', 'last_name'):
+        if col in df_masked.columns:
+            s = df_masked[col].astype('string')
+            keep = s.isna() | s.eq('') | s.eq('[UNKNOWN]')
+            df_masked[col] = s.where(keep, s.str.strip().str[0] + '***')
 
     if 'email' in df_masked.columns:
-        df_masked['email'] = df_masked['email'].apply(mask_email)
+        s = df_masked['email'].astype('string')
+        stripped = s.str.strip()
+        parts = stripped.str.rpartition('@')
+        masked = parts[0].str[0].fillna('') + '***@' + parts[2]
+        has_at = parts[1].eq('@')
+        keep = s.isna() | s.eq('')
+        df_masked['email'] = stripped.where(~has_at, masked).where(~keep, s)
 
     if 'phone' in df_masked.columns:
-        df_masked['phone'] = df_masked['phone'].apply(mask_phone)
+        s = df_masked['phone'].astype('string')
+        digits = s.str.replace(_NON_DIGIT_RE, '', regex=True)
+        masked = ('***-***-' + digits.str[-4:]).where(digits.str.len() >= 4,
+                                                      '***-***-****')
+        keep = s.isna() | s.eq('')
+        df_masked['phone'] = masked.where(~keep, s)
 
     if 'date_of_birth' in df_masked.columns:
-        df_masked['date_of_birth'] = df_masked['date_of_birth'].apply(mask_dob)
+        s = df_masked['date_of_birth'].astype('string')
+        stripped = s.str.strip()
+        masked = (stripped.str[:4] + '-**-**').where(stripped.str.len() >= 4,
+                                                     stripped)
+        keep = s.isna() | s.eq('') | s.eq('[UNKNOWN]')
+        df_masked['date_of_birth'] = masked.where(~keep, s)
 
     if 'address' in df_masked.columns:
-        df_masked['address'] = df_masked['address'].apply(mask_address)
+        s = df_masked['address'].astype('string')
+        keep = s.isna() | s.eq('') | s.eq('[UNKNOWN]')
+        df_masked['address'] = s.where(keep, '[MASKED ADDRESS]')
 
     return df_masked
 
@@ -109,10 +136,8 @@ def generate_sample_comparison(df_original, df_masked):
     columns = list(df_original.columns)
     sample.append(", ".join(columns))
 
-    for i in range(min(3, len(df_original))):
-        row = df_original.iloc[i]
-        values = [str(row[col]) for col in columns]
-        sample.append(", ".join(values))
+    for row in df_original.head(3).itertuples(index=False):
+        sample.append(", ".join(map(str, row)))
 
     sample.append("")
     sample.append("AFTER MASKING (first 3 rows):")
@@ -120,10 +145,8 @@ def generate_sample_comparison(df_original, df_masked):
 
     sample.append(", ".join(columns))
 
-    for i in range(min(3, len(df_masked))):
-        row = df_masked.iloc[i]
-        values = [str(row[col]) for col in columns]
-        sample.append(", ".join(values))
+    for row in df_masked.head(3).itertuples(index=False):
+        sample.append(", ".join(map(str, row)))
 
     sample.append("")
     sample.append("ANALYSIS:")
@@ -4,260 +4,427 @@ Part 3: Build a Data Validator
 """
 
 import pandas as pd
+import numpy as np
 import re
 from datetime import datetime
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce
+from operator import or_
+
+
+# Compiled once at import and applied with fullmatch, which anchors both
+# ends itself (a trailing $ would still accept 'foo@bar.com\n')
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_NAME_RE = re.compile(r'[a-zA-Z\s\-]+')
+_NONDIGIT_RE = re.compile(r'\D')
+
+# google-re2 matches in linear time (no backtracking), so hostile input
+# cannot blow up the email/name scans; it is optional and we fall back to
+# the stdlib engine when it is not installed
+try:
+    import re2
+    _EMAIL_RE2 = re2.compile(_EMAIL_RE.pattern)
+    _NAME_RE2 = re2.compile(_NAME_RE.pattern)
+except ImportError:
+    _EMAIL_RE2 = None
+    _NAME_RE2 = None
+
+
+try:
+    from numba import njit
+
+    @njit(cache=True)
+    def _income_masks(arr):
+        """Fused nan/negative/over-limit scan over a float64 array."""
+        n = arr.size
+        nan = np.zeros(n, np.bool_)
+        neg = np.zeros(n, np.bool_)
+        over = np.zeros(n, np.bool_)
+        for i in range(n):
+            value = arr[i]
+            if np.isnan(value):
+                nan[i] = True
+            elif value < 0:
+                neg[i] = True
+            elif value > 10000000:
+                over[i] = True
+        return nan, neg, over
+except ImportError:
+    # numba is optional; NumPy computes the same three masks
+    def _income_masks(arr):
+        """nan/negative/over-limit masks over a float64 array."""
+        nan = np.isnan(arr)
+        return nan, ~nan & (arr < 0), ~nan & (arr > 10000000)
+
+
+def _match_mask(s, re_pattern, re2_pattern):
+    """Boolean array marking rows of string Series s that fully match.
+
+    Missing values count as non-matches. Uses the re2 pattern when the
+    engine is available, otherwise the stdlib pattern via the accessor.
+    """
+    if re2_pattern is not None:
+        is_match = np.frompyfunc(
+            lambda value: re2_pattern.fullmatch(value) is not None, 1, 1)
+        return is_match(s.fillna('').to_numpy(dtype=object)).astype(bool)
+    return s.str.fullmatch(re_pattern).fillna(False).to_numpy()
 
 
 def load_data(filepath):
     """Load CSV file into pandas DataFrame."""
-    df = pd.read_csv(filepath)
+    df = pd.read_csv(filepath, engine='pyarrow', dtype_backend='pyarrow')
     df.columns = df.columns.str.strip()
     return df
 
 
+# Chunked reading keeps peak memory bounded by the chunk, not the file
+CHUNK_SIZE = 100_000
+
+# Explicit dtypes skip inference; Arrow-backed strings keep the str
+# accessors on Arrow's compiled kernels instead of Python object arrays.
+# customer_id and income stay strings here on purpose: a numeric read
+# dtype would make read_csv raise on junk values, while the validators'
+# pd.to_numeric(errors='coerce') masks exist to report exactly those rows
+CSV_DTYPES = {
+    'customer_id': 'string[pyarrow]',
+    'first_name': 'string[pyarrow]',
+    'last_name': 'string[pyarrow]',
+    'email': 'string[pyarrow]',
+    'phone': 'string[pyarrow]',
+    'date_of_birth': 'string[pyarrow]',
+    'address': 'string[pyarrow]',
+    'income': 'string[pyarrow]',
+    'account_status': 'string[pyarrow]',
+    'created_date': 'string[pyarrow]',
+}
+
+
+def iter_chunks(filepath, chunksize=CHUNK_SIZE):
+    """Yield DataFrame chunks of the CSV with stripped column names."""
+    with pd.read_csv(filepath, dtype=CSV_DTYPES, chunksize=chunksize,
+                     skipinitialspace=True) as reader:
+        for chunk in reader:
+            chunk.columns = chunk.columns.str.strip()
+            yield chunk
+
+
 class DataValidator:
     """Validator class to check data against schema rules."""
-    
-    def __init__(self, df):
+
+    def __init__(self, df, row_offset=0):
         self.df = df
-        self.failures = []
-        self.passed_rows = set(range(len(df)))
+        # Number of data rows that precede this frame in the source file,
+        # so chunked runs still report file-level row numbers
+        self.row_offset = row_offset
+        # Failures are stored as three parallel lists (structure-of-arrays)
+        # instead of one dict per failure: _rows[i], _cols[i] and _issues[i]
+        # together describe the i-th failure.
+        self._rows = []
+        self._cols = []
+        self._issues = []
+        # One bool per row is all the pass/fail summary needs
+        self._row_failed = np.zeros(len(df), dtype=bool)
+
+    @property
+    def passed_rows(self):
+        """Indices of rows that passed every validation."""
+        return np.flatnonzero(~self._row_failed)
     
     def validate_customer_id(self):
         """Validate customer_id: unique, positive integer."""
-        ids_seen = set()
-        
-        for idx, value in enumerate(self.df['customer_id']):
+        if 'customer_id' not in self.df.columns:
+            return None
+        col = self.df['customer_id']
+        # Downcast shrinks only this scan copy; messages quote the raw
+        # column, so no narrowed representation leaks into the report
+        num = pd.to_numeric(col, errors='coerce', downcast='integer')
+
+        empty_mask = col.isna().to_numpy()
+        nonint_mask = ((col.notna() & num.isna())
+                       | (num.notna() & (num % 1 != 0))).fillna(False).to_numpy()
+        nonpos_mask = (num.notna() & (num % 1 == 0)
+                       & (num <= 0)).fillna(False).to_numpy()
+        # duplicated() runs a C-level hash pass over the raw array; only the
+        # second and later occurrences of a non-null id are flagged
+        dup_mask = (col.duplicated(keep='first') & col.notna()).to_numpy()
+
+        values = col.to_numpy(dtype=object)
+
+        def fmt(idx):
             issues = []
-            
+
             # Check if positive integer
-            if pd.isna(value):
+            if empty_mask[idx]:
                 issues.append("Empty (should be non-empty)")
-            else:
-                try:
-                    val = int(value)
-                    if val <= 0:
-                        issues.append(f"{value} (should be positive)")
-                except (ValueError, TypeError):
-                    issues.append(f"{value} (should be integer)")
-            
+            elif nonint_mask[idx]:
+                issues.append(f"{values[idx]} (should be integer)")
+            elif nonpos_mask[idx]:
+                issues.append(f"{values[idx]} (should be positive)")
+
             # Check uniqueness
-            if pd.notna(value):
-                if value in ids_seen:
-                    issues.append(f"{value} (duplicate ID)")
-                else:
-                    ids_seen.add(value)
-            
-            if issues:
-                self.add_failure(idx, 'customer_id', issues)
+            if dup_mask[idx]:
+                issues.append(f"{values[idx]} (duplicate ID)")
+
+            return issues
+
+        return 'customer_id', [empty_mask, nonint_mask, nonpos_mask, dup_mask], fmt
     
     def validate_name(self, column):
         """Validate name fields: non-null, letters only, 2-50 chars."""
-        for idx, value in enumerate(self.df[column]):
+        if column not in self.df.columns:
+            return None
+        s = self.df[column].astype('string').str.strip()
+        lengths = s.str.len().fillna(0).astype('int64').to_numpy()
+
+        empty_mask = (s.isna() | s.eq('')).to_numpy()
+        too_short = ~empty_mask & (lengths < 2)
+        too_long = lengths > 50
+        # Non-alphabetic check (spaces and hyphens allowed for compound names)
+        nonalpha = ~empty_mask & ~_match_mask(s, _NAME_RE, _NAME_RE2)
+
+        values = s.to_numpy(dtype=object)
+
+        def fmt(idx):
             issues = []
-            
-            if pd.isna(value) or str(value).strip() == '':
+
+            if empty_mask[idx]:
                 issues.append("Empty (should be non-empty)")
             else:
-                name = str(value).strip()
-                
-                # Check length
-                if len(name) < 2:
-                    issues.append(f"'{name}' (too short, min 2 chars)")
-                elif len(name) > 50:
-                    issues.append(f"'{name}' (too long, max 50 chars)")
-                
-                # Check alphabetic (allow spaces and hyphens for compound names)
-                if not re.match(r'^[a-zA-Z\s\-]+$', name):
-                    issues.append(f"'{name}' (should be alphabetic)")
-            
-            if issues:
-                self.add_failure(idx, column, issues)
+                if too_short[idx]:
+                    issues.append(f"'{values[idx]}' (too short, min 2 chars)")
+                elif too_long[idx]:
+                    issues.append(f"'{values[idx]}' (too long, max 50 chars)")
+
+                if nonalpha[idx]:
+                    issues.append(f"'{values[idx]}' (should be alphabetic)")
+
+            return issues
+
+        return column, [empty_mask, too_short, too_long, nonalpha], fmt
     
     def validate_email(self):
         """Validate email: valid email format."""
-        email_pattern = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
-        
-        for idx, value in enumerate(self.df['email']):
-            issues = []
-            
-            if pd.isna(value) or str(value).strip() == '':
-                issues.append("Empty (should be non-empty)")
-            else:
-                email = str(value).strip()
-                if not email_pattern.match(email):
-                    issues.append(f"'{email}' (invalid email format)")
-            
-            if issues:
-                self.add_failure(idx, 'email', issues)
+        if 'email' not in self.df.columns:
+            return None
+        s = self.df['email'].astype('string').str.strip()
+        empty_mask = (s.isna() | s.eq('')).to_numpy()
+        valid = _match_mask(s, _EMAIL_RE, _EMAIL_RE2)
+        invalid_mask = (~empty_mask) & (~valid)
+
+        values = s.to_numpy(dtype=object)
+
+        def fmt(idx):
+            if empty_mask[idx]:
+                return ["Empty (should be non-empty)"]
+            return [f"'{values[idx]}' (invalid email format)"]
+
+        return 'email', [empty_mask, invalid_mask], fmt
     
     def validate_phone(self):
         """Validate phone: reasonable length and format."""
-        for idx, value in enumerate(self.df['phone']):
-            issues = []
-            
-            if pd.isna(value) or str(value).strip() == '':
-                issues.append("Empty (should be non-empty)")
-            else:
-                phone = str(value).strip()
-                # Extract digits only
-                digits = re.sub(r'\D', '', phone)
-                
-                if len(digits) != 10:
-                    issues.append(f"'{phone}' (should have 10 digits, found {len(digits)})")
-            
-            if issues:
-                self.add_failure(idx, 'phone', issues)
+        if 'phone' not in self.df.columns:
+            return None
+        s = self.df['phone'].astype('string').str.strip()
+        digit_lens = s.str.replace(_NONDIGIT_RE, '', regex=True).str.len()
+        lengths = digit_lens.fillna(0).astype('int64').to_numpy()
+
+        empty_mask = (s.isna() | s.eq('')).to_numpy()
+        invalid_mask = ~empty_mask & (lengths != 10)
+
+        values = s.to_numpy(dtype=object)
+
+        def fmt(idx):
+            if empty_mask[idx]:
+                return ["Empty (should be non-empty)"]
+            return [f"'{values[idx]}' (should have 10 digits, found {lengths[idx]})"]
+
+        return 'phone', [empty_mask, invalid_mask], fmt
     
+    DATE_FORMATS = ['%Y-%m-%d', '%Y/%m/%d', '%m/%d/%Y']
+
     def validate_date(self, column):
         """Validate date fields: valid date, YYYY-MM-DD format."""
-        for idx, value in enumerate(self.df[column]):
-            issues = []
-            
-            if pd.isna(value) or str(value).strip() == '':
-                issues.append("Empty (should be non-empty)")
-            else:
-                date_str = str(value).strip()
-                
-                # Check for invalid_date string
-                if date_str.lower() == 'invalid_date':
-                    issues.append("'invalid_date' (invalid date value)")
-                else:
-                    # Try to parse date
-                    parsed = False
-                    formats = ['%Y-%m-%d', '%Y/%m/%d', '%m/%d/%Y']
-                    
-                    for fmt in formats:
-                        try:
-                            datetime.strptime(date_str, fmt)
-                            parsed = True
-                            break
-                        except ValueError:
-                            continue
-                    
-                    if not parsed:
-                        issues.append(f"'{date_str}' (unrecognized date format)")
-            
-            if issues:
-                self.add_failure(idx, column, issues)
+        if column not in self.df.columns:
+            return None
+        s = self.df[column].astype('string').str.strip()
+
+        # Probe a small sample for the dominant format so the common
+        # single-format column is parsed in one full pass
+        probe = s.dropna().head(100)
+        dominant = self.DATE_FORMATS[0]
+        for fmt in self.DATE_FORMATS:
+            parse_rate = pd.to_datetime(probe, format=fmt,
+                                        errors='coerce').notna().mean()
+            if parse_rate > 0.8:
+                dominant = fmt
+                break
+
+        # Remaining formats are tried only on the rows still unparsed
+        parsed = pd.to_datetime(s, format=dominant, errors='coerce')
+        for fmt in self.DATE_FORMATS:
+            if fmt == dominant:
+                continue
+            residual = parsed.isna() & s.notna()
+            if not residual.any():
+                break
+            parsed = parsed.fillna(
+                pd.to_datetime(s[residual], format=fmt, errors='coerce'))
+
+        empty_mask = (s.isna() | s.eq('')).to_numpy()
+        invalid_literal = s.str.lower().eq('invalid_date').fillna(False).to_numpy()
+        bad_mask = ~empty_mask & ~invalid_literal & parsed.isna().to_numpy()
+
+        values = s.to_numpy(dtype=object)
+
+        def fmt(idx):
+            if empty_mask[idx]:
+                return ["Empty (should be non-empty)"]
+            if invalid_literal[idx]:
+                return ["'invalid_date' (invalid date value)"]
+            return [f"'{values[idx]}' (unrecognized date format)"]
+
+        return column, [empty_mask, invalid_literal, bad_mask], fmt
     
     def validate_address(self):
         """Validate address: non-empty, 10-200 chars."""
-        for idx, value in enumerate(self.df['address']):
-            issues = []
-            
-            if pd.isna(value) or str(value).strip() == '':
-                issues.append("Empty (should be non-empty)")
-            else:
-                address = str(value).strip()
-                
-                if len(address) < 10:
-                    issues.append(f"'{address}' (too short, min 10 chars)")
-                elif len(address) > 200:
-                    issues.append(f"'{address}' (too long, max 200 chars)")
-            
-            if issues:
-                self.add_failure(idx, 'address', issues)
+        if 'address' not in self.df.columns:
+            return None
+        s = self.df['address'].astype('string').str.strip()
+        empty_mask = (s.isna() | s.eq('')).to_numpy()
+        lengths = s.str.len()
+        short_mask = ~empty_mask & (lengths < 10).fillna(False).to_numpy()
+        long_mask = ~empty_mask & (lengths > 200).fillna(False).to_numpy()
+
+        values = s.to_numpy(dtype=object)
+
+        def fmt(idx):
+            if empty_mask[idx]:
+                return ["Empty (should be non-empty)"]
+            if short_mask[idx]:
+                return [f"'{values[idx]}' (too short, min 10 chars)"]
+            return [f"'{values[idx]}' (too long, max 200 chars)"]
+
+        return 'address', [empty_mask, short_mask, long_mask], fmt
     
     def validate_income(self):
         """Validate income: non-negative, ≤ $10M."""
-        for idx, value in enumerate(self.df['income']):
-            issues = []
-            
-            if pd.isna(value):
-                issues.append("Empty (should be non-empty)")
-            else:
-                try:
-                    income_val = float(value)
-                    
-                    if income_val < 0:
-                        issues.append(f"{income_val} (should be non-negative)")
-                    elif income_val > 10000000:
-                        issues.append(f"{income_val} (exceeds $10M limit)")
-                except (ValueError, TypeError):
-                    issues.append(f"'{value}' (should be numeric)")
-            
-            if issues:
-                self.add_failure(idx, 'income', issues)
+        if 'income' not in self.df.columns:
+            return None
+        col = self.df['income']
+        num = pd.to_numeric(col, errors='coerce')
+
+        # One fused kernel pass computes all three numeric masks
+        scan = num.to_numpy(dtype='float64', na_value=np.nan)
+        nan_mask, negative, over_limit = _income_masks(scan)
+
+        empty_mask = col.isna().to_numpy()
+        non_numeric = ~empty_mask & nan_mask
+        raw_values = col.to_numpy(dtype=object)
+
+        def fmt(idx):
+            # Messages are formatted from the raw value so no narrowed
+            # scan representation can distort the reported amount
+            if empty_mask[idx]:
+                return ["Empty (should be non-empty)"]
+            if non_numeric[idx]:
+                return [f"'{raw_values[idx]}' (should be numeric)"]
+            if negative[idx]:
+                return [f"{float(raw_values[idx])} (should be non-negative)"]
+            return [f"{float(raw_values[idx])} (exceeds $10M limit)"]
+
+        return 'income', [empty_mask, non_numeric, negative, over_limit], fmt
     
     def validate_account_status(self):
         """Validate account_status: must be active, inactive, or suspended."""
-        valid_statuses = {'active', 'inactive', 'suspended'}
-        
-        for idx, value in enumerate(self.df['account_status']):
-            issues = []
-            
-            if pd.isna(value) or str(value).strip() == '':
-                issues.append("Empty (should be one of: active, inactive, suspended)")
-            else:
-                status = str(value).strip().lower()
-                if status not in valid_statuses:
-                    issues.append(f"'{value}' (invalid value, should be: active, inactive, suspended)")
-            
-            if issues:
-                self.add_failure(idx, 'account_status', issues)
+        if 'account_status' not in self.df.columns:
+            return None
+        s = self.df['account_status'].astype('string').str.strip()
+        empty_mask = (s.isna() | s.eq('')).to_numpy()
+        # Categorical encodes each status as an int8 code; anything outside
+        # the three valid categories (including NA) maps to -1, so validity
+        # becomes one integer compare instead of per-row set membership
+        cat = pd.Categorical(s.str.lower(),
+                             categories=['active', 'inactive', 'suspended'])
+        invalid_mask = ~empty_mask & (cat.codes == -1)
+
+        raw_values = self.df['account_status'].to_numpy(dtype=object)
+
+        def fmt(idx):
+            if empty_mask[idx]:
+                return ["Empty (should be one of: active, inactive, suspended)"]
+            return [f"'{raw_values[idx]}' (invalid value, should be: active, inactive, suspended)"]
+
+        return 'account_status', [empty_mask, invalid_mask], fmt
     
     def add_failure(self, row_idx, column, issues):
         """Add a validation failure."""
-        self.failures.append({
-            'row': row_idx + 2,  # +2 for 1-indexed and header
-            'column': column,
-            'issues': issues
-        })
-        if row_idx in self.passed_rows:
-            self.passed_rows.remove(row_idx)
+        # +2 for 1-indexed and header, plus the rows of earlier chunks
+        self._rows.append(row_idx + 2 + self.row_offset)
+        self._cols.append(column)
+        self._issues.append(issues)
+        self._row_failed[row_idx] = True
     
     def run_all_validations(self):
         """Run all validation rules."""
         print("Running validations...")
-        
-        self.validate_customer_id()
-        print("OK Validated customer_id")
-        
-        self.validate_name('first_name')
-        print("OK Validated first_name")
-        
-        self.validate_name('last_name')
-        print("OK Validated last_name")
-        
-        self.validate_email()
-        print("OK Validated email")
-        
-        self.validate_phone()
-        print("OK Validated phone")
-        
-        self.validate_date('date_of_birth')
-        print("OK Validated date_of_birth")
-        
-        self.validate_address()
-        print("OK Validated address")
-        
-        self.validate_income()
-        print("OK Validated income")
-        
-        self.validate_account_status()
-        print("OK Validated account_status")
-        
-        self.validate_date('created_date')
-        print("OK Validated created_date")
-        
-        print(f"\nValidation complete: {len(self.passed_rows)}/{len(self.df)} rows passed")
+
+        builders = [
+            ('customer_id', self.validate_customer_id),
+            ('first_name', lambda: self.validate_name('first_name')),
+            ('last_name', lambda: self.validate_name('last_name')),
+            ('email', self.validate_email),
+            ('phone', self.validate_phone),
+            ('date_of_birth', lambda: self.validate_date('date_of_birth')),
+            ('address', self.validate_address),
+            ('income', self.validate_income),
+            ('account_status', self.validate_account_status),
+            ('created_date', lambda: self.validate_date('created_date')),
+        ]
+
+        # The validators read disjoint columns and only build masks, so they
+        # can run concurrently; pandas string/numeric kernels release the GIL
+        # for much of the work. Results are collected in submission order so
+        # failure emission (and the report) keep the original column order.
+        specs = []
+        with ThreadPoolExecutor(max_workers=len(builders)) as pool:
+            futures = [(label, pool.submit(build)) for label, build in builders]
+            for label, future in futures:
+                specs.append(future.result())
+                print(f"OK Validated {label}")
+
+        # Single fused emission phase: each column's masks are OR-reduced
+        # and only the failing rows are materialized as issue strings
+        for spec in specs:
+            if spec is None:  # column missing from this frame
+                continue
+            column, masks, fmt = spec
+            union = reduce(or_, masks)
+            # Fully clean column: skip index extraction and all per-row work
+            if not bool(union.any()):
+                continue
+            for idx in np.flatnonzero(union):
+                self.add_failure(idx, column, fmt(idx))
+
+        passed_count = int((~self._row_failed).sum())
+        print(f"\nValidation complete: {passed_count}/{len(self.df)} rows passed")
     
     def get_failures_by_column(self):
-        """Group failures by column."""
-        by_column = defaultdict(list)
-        for failure in self.failures:
-            by_column[failure['column']].append(failure)
-        return by_column
+        """Group failures by column as indices into the parallel lists."""
+        cols = np.asarray(self._cols)
+        return {col: np.flatnonzero(cols == col) for col in np.unique(cols)}
+
 
+def generate_validation_report(rows, cols, issues, passed_count, total_rows):
+    """Generate the validation results report from merged failure lists.
 
-def generate_validation_report(validator, df):
-    """Generate the validation results report."""
-    total_rows = len(df)
-    passed_count = len(validator.passed_rows)
+    rows/cols/issues are the parallel failure lists collected across all
+    validated chunks, so one report covers the whole file.
+    """
     failed_count = total_rows - passed_count
-    failures_by_column = validator.get_failures_by_column()
+    cols_arr = np.asarray(cols)
+    failures_by_column = {col: np.flatnonzero(cols_arr == col)
+                          for col in np.unique(cols_arr)}
     
     report = []
     report.append("VALIDATION RESULTS")
@@ -283,24 +450,21 @@ def generate_validation_report(validator, df):
     for column in column_order:
         if column in failures_by_column:
             report.append(f"{column}:")
-            for failure in failures_by_column[column]:
-                for issue in failure['issues']:
-                    report.append(f"  - Row {failure['row']}: {issue}")
+            report.append("\n".join(
+                f"  - Row {rows[i]}: {issue}"
+                for i in failures_by_column[column]
+                for issue in issues[i]
+            ))
             report.append("")
-    
-    # Summary statistics
+
+    # Summary statistics: one counts lookup per column, one joined block
+    counts = {col: len(idxs) for col, idxs in failures_by_column.items()}
     report.append("VALIDATION SUMMARY:")
     report.append("-" * 30)
-    report.append(f"- customer_id: {total_rows - len(failures_by_column.get('customer_id', []))}/{total_rows} valid")
-    report.append(f"- first_name: {total_rows - len(failures_by_column.get('first_name', []))}/{total_rows} valid")
-    report.append(f"- last_name: {total_rows - len(failures_by_column.get('last_name', []))}/{total_rows} valid")
-    report.append(f"- email: {total_rows - len(failures_by_column.get('email', []))}/{total_rows} valid")
-    report.append(f"- phone: {total_rows - len(failures_by_column.get('phone', []))}/{total_rows} valid")
-    report.append(f"- date_of_birth: {total_rows - len(failures_by_column.get('date_of_birth', []))}/{total_rows} valid")
-    report.append(f"- address: {total_rows - len(failures_by_column.get('address', []))}/{total_rows} valid")
-    report.append(f"- income: {total_rows - len(failures_by_column.get('income', []))}/{total_rows} valid")
-    report.append(f"- account_status: {total_rows - len(failures_by_column.get('account_status', []))}/{total_rows} valid")
-    report.append(f"- created_date: {total_rows - len(failures_by_column.get('created_date', []))}/{total_rows} valid")
+    report.append("\n".join(
+        f"- {col}: {total_rows - counts.get(col, 0)}/{total_rows} valid"
+        for col in column_order
+    ))
     report.append("")
     
     report.append("=" * 50)
@@ -311,16 +475,27 @@ def generate_validation_report(validator, df):
 
 def main():
     """Main function to run data validation."""
-    # Load data
-    df = load_data('data/customer_raw.csv')
-    print(f"Validating {len(df)} rows against schema rules...\n")
-    
-    # Create validator and run validations
-    validator = DataValidator(df)
-    validator.run_all_validations()
-    
+    print(f"Validating data/customer_raw.csv against schema rules "
+          f"(chunks of {CHUNK_SIZE} rows)...\n")
+
+    # Validate chunk by chunk so peak memory stays bounded; failure lists
+    # and the pass count are merged incrementally across chunks
+    rows, cols, issues = [], [], []
+    total_rows = 0
+    passed_count = 0
+
+    for chunk in iter_chunks('data/customer_raw.csv'):
+        validator = DataValidator(chunk, row_offset=total_rows)
+        validator.run_all_validations()
+        rows.extend(validator._rows)
+        cols.extend(validator._cols)
+        issues.extend(validator._issues)
+        passed_count += int(len(validator.passed_rows))
+        total_rows += len(chunk)
+
     # Generate report
-    report = generate_validation_report(validator, df)
+    report = generate_validation_report(rows, cols, issues,
+                                        passed_count, total_rows)
     
     # Save report
     with open('docs/validation_results.txt', 'w', encoding='utf-8') as f: